@@ -121,6 +121,13 @@ def _steady_parameters(func):
         default=None,
         help="0..99; prepend INTEGER to the destination root directory name.",
     )
+    @click.option(
+        "-j",
+        "--jobs",
+        type=click.IntRange(min=1),
+        default=None,
+        help="Tag up to INTEGER files ahead in parallel (default: one per CPU, up to 8).",
+    )
     @click.option("--context", is_flag=True, hidden=True, help="Print clean context.")
     @click.option("--no-console", is_flag=True, hidden=True, help="No console mode.")
     @click.argument("src", type=click.Path(exists=True, resolve_path=True))
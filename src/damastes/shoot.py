@@ -10,11 +10,24 @@ import re
 import shutil
 import sys
 import warnings
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
 from math import log
 from pathlib import Path
-from tempfile import mkstemp
+from tempfile import SpooledTemporaryFile
 from time import perf_counter
-from typing import Iterator, List, Tuple
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    TypeVar,
+)
 
 import mutagen
 from yaspin import yaspin  # type: ignore
@@ -34,7 +47,7 @@ def str_strip_numbers(str_alphanum: str) -> List[int]:
     >>> str_strip_numbers("ab11cdd2k.144")
     [11, 2, 144]
     """
-    return [int(x) for x in re.compile(r"\d+").findall(str_alphanum)]
+    return list(map(int, RE_DIGITS.findall(str_alphanum)))
 
 
 Ord = int  # LT (negative), EQ (zero) GT (positive).
@@ -62,85 +75,117 @@ def strcmp_naturally(str_x: str, str_y: str) -> Ord:
     values embedded in the strings, otherwise returns the standard string comparison.
     The idea of the natural sort as opposed to the standard lexicographic sort is one of coping
     with the possible absence of the leading zeros in 'numbers' of files or directories.
+    The copy order no longer follows this comparison, but strkey_naturally(),
+    which compares the text between the numbers as well: the two disagree on
+    names like "Prologue 1" and "Chapter 2".
 
     >>> strcmp_naturally("2charlie", "10alfa")
     -1
     >>> strcmp_naturally("charlie", "zulu")
     -1
+    >>> strcmp_naturally("Prologue 1", "Chapter 2")
+    -1
+    >>> sorted(["Prologue 1", "Chapter 2"], key=strkey_naturally)
+    ['Chapter 2', 'Prologue 1']
     """
     num_x = str_strip_numbers(str_x)
     num_y = str_strip_numbers(str_y)
-    return (
-        strcmp_c(num_x, num_y)
-        if num_x != [] and num_y != []
-        else strcmp_c(str_x, str_y)
-    )
+    return strcmp_c(num_x, num_y) if num_x and num_y else strcmp_c(str_x, str_y)
 
 
-def _path_compare(path_x: Path, path_y: Path) -> Ord:
+def strkey_naturally(str_alphanum: str) -> Tuple[str | int, ...]:
     """
-    Compares two paths (directories).
+    Returns a natural sort key: the string split into alternating runs
+    of non-digits and digits, the latter as integers. Every key starts with
+    a (possibly empty) non-digit run, so the types never clash on comparison.
+
+    >>> sorted(["10alfa", "2charlie", "bravo"], key=strkey_naturally)
+    ['2charlie', '10alfa', 'bravo']
+    >>> sorted(["Outro", "10 Ten", "02 Two", "01 Intro"], key=strkey_naturally)
+    ['01 Intro', '02 Two', '10 Ten', 'Outro']
     """
-    return (
-        strcmp_c(str(path_x), str(path_y))
-        if _ARGS.sort_lex
-        else strcmp_naturally(str(path_x), str(path_y))
-    )
+    return _str_runs(str_alphanum)
 
 
-def _file_compare(path_x: Path, path_y: Path) -> Ord:
+@functools.lru_cache(maxsize=4096)
+def _str_runs(str_alphanum: str) -> Tuple[str | int, ...]:
     """
-    Compares two paths, filenames only, ignoring extensions.
+    Returns strkey_naturally(), memoized: stems
+    like "01 Track 1" tend to recur from directory to directory.
     """
-    return (
-        strcmp_c(path_x.stem, path_y.stem)
-        if _ARGS.sort_lex
-        else strcmp_naturally(path_x.stem, path_y.stem)
+    return tuple(
+        int(run) if i & 1 else run
+        for i, run in enumerate(RE_DIGIT_RUNS.split(str_alphanum))
     )
 
 
-def _mutagen_file(name: Path, spinner=None):  # pragma: no cover
+_SortKey = str | Tuple[str | int, ...]
+
+
+def _sort_keys() -> (
+    Tuple[Callable[[os.DirEntry], _SortKey], Callable[[Path], _SortKey]]
+):
     """
-    Returns Mutagen thing, if name looks like an audio file path, else returns None.
+    Returns the pair of sort keys for a walk, directories and audiofiles,
+    picked once by the options; a file sorts on its name sans extension.
+    """
+    if _ARGS.sort_lex:
+
+        def dir_key(entry: os.DirEntry) -> _SortKey:
+            return entry.name
+
+        def file_key(file: Path) -> _SortKey:
+            return file.stem
+
+    else:
+
+        def dir_key(entry: os.DirEntry) -> _SortKey:
+            return strkey_naturally(entry.name)
+
+        def file_key(file: Path) -> _SortKey:
+            return strkey_naturally(file.stem)
+
+    return dir_key, file_key
+
+
+def _file_type_filter() -> Callable[[str], bool]:
+    """
+    Returns a predicate on file names, specialized once according to the options:
+    the --file-type glob or extension, or else any known audio extension.
+    Spares Mutagen the header sniffing of files that won't do anyway.
     """
-    global _INVALID_TOTAL, _SUSPICIOUS_TOTAL  # pylint:disable=global-statement
-    ext = name.suffix.lstrip(".").upper()
     atp = _ARGS.file_type
+    if atp and ("*" in atp or "?" in atp or "[" in atp):
+        return lambda name: fnmatch.fnmatch(name, atp)
 
-    if atp:
-        if "*" in atp or "?" in atp or "[" in atp:
-            if not fnmatch.fnmatch(name.name, atp):
-                return None
-        else:
-            if ext != atp.lstrip(".").upper():
-                return None
+    extensions = frozenset([atp.lstrip(".").upper()]) if atp else AUDIO_EXTENSIONS
+    return lambda name: os.path.splitext(name)[1][1:].upper() in extensions
 
-    name_to_print: str = str(name) if _ARGS.verbose else name.name
+
+def _mutagen_file(name: Path, spinner=None):  # pragma: no cover
+    """
+    Returns Mutagen thing, if name is a readable audio file, else returns None.
+    The name is supposed to have passed _file_type_filter() already.
+    """
+    global _INVALID_TOTAL, _SUSPICIOUS_TOTAL  # pylint:disable=global-statement
 
     try:
         file = mutagen.File(name, easy=True)  # type: ignore
     except mutagen.MutagenError as mt_error:  # type: ignore
         if spinner:
-            spinner.write(f" {INVALID_ICON} >>{mt_error}>> {name_to_print}")
+            spinner.write(f" {INVALID_ICON} >>{mt_error}>> {_name_to_print(name)}")
         _INVALID_TOTAL += 1  # pylint:disable=undefined-variable
         return None
 
-    if file is None and ext in KNOWN_EXTENSIONS:
+    if file is None and name.suffix.lstrip(".").upper() in KNOWN_EXTENSIONS:
         if spinner:
-            spinner.write(f" {SUSPICIOUS_ICON} {name_to_print}")
+            spinner.write(f" {SUSPICIOUS_ICON} {_name_to_print(name)}")
         _SUSPICIOUS_TOTAL += 1  # pylint:disable=undefined-variable
     return file
 
 
-def _is_audiofile(name: Path, spinner=None) -> bool:  # pragma: no cover
-    """
-    Returns True, if name is an audio file, else returns False.
-    """
-    if name.is_file():
-        file = _mutagen_file(name, spinner)
-        if file is not None:
-            return True
-    return False
+def _name_to_print(name: Path) -> str:
+    return str(name) if _ARGS.verbose else name.name
 
 
 def _artist_part(*, prefix="", suffix="") -> str:
@@ -152,102 +197,107 @@ def _artist_part(*, prefix="", suffix="") -> str:
     return ""
 
 
-def _file_decorate(i: int, step_down: List[str], file: Path) -> str:
+_FileDecorator = Callable[[int, List[str], Path], str]
+
+
+def _file_decorator() -> _FileDecorator:
     """
-    Prepends zero padded decimal i to path name.
+    Returns a function prepending zero padded decimal i to path name,
+    specialized according to the options, so that the options are looked up
+    once, not per file.
     """
     if _ARGS.strip_decorations and _ARGS.tree_dst:
-        return file.name
-    prefix = str(i).zfill(len(str(_FILES_TOTAL))) + (
-        "-[" + "][".join(step_down) + "]-"
-        if _ARGS.prepend_subdir_name and not _ARGS.tree_dst and len(step_down) > 0
-        else "-"
-    )
-    return prefix + (
-        _ARGS.unified_name + _artist_part(prefix=" - ") + file.suffix
-        if _ARGS.unified_name
-        else file.name
+        return lambda i, step_down, file: file.name
+
+    pad = f"0{len(str(_FILES_TOTAL))}d"  # Format spec fixed once.
+    unified_stem = (
+        _ARGS.unified_name + _artist_part(prefix=" - ") if _ARGS.unified_name else ""
     )
 
+    if not _ARGS.prepend_subdir_name or _ARGS.tree_dst:
+        if unified_stem:
+            return lambda i, step_down, file: f"{i:{pad}}-{unified_stem}{file.suffix}"
+        return lambda i, step_down, file: f"{i:{pad}}-{file.name}"
 
-_DirWalkItem = Tuple[int, List[str], Path]
-_DirWalkIterator = Iterator[_DirWalkItem]
+    last_step_down: List[str] = []
+    subdir_prefix = ""
 
+    def file_decorate(i: int, step_down: List[str], file: Path) -> str:
+        nonlocal last_step_down, subdir_prefix
 
-def _dir_walk(
-    src: Path, step_down: List[str], fcount: List[int]
-) -> _DirWalkIterator:  # pragma: no cover
-    """
-    Walks down the src tree, accumulating step_down on each recursion level.
-    Yields a tuple of:
-    (index, list of subdirectories to be joined
-    at destination if necessary, source audiofile name)
-    """
-    if _is_audiofile(src):
-        dirs: List[Path] = []
-        files: List[Path] = [Path(src.name)]
-        src = src.parent
-    else:
-        lst = os.listdir(src)
-        dirs = sorted(
-            [Path(x) for x in lst if (src / x).is_dir()],
-            key=functools.cmp_to_key(
-                (lambda xp, yp: _path_compare(yp, xp))
-                if _ARGS.reverse
-                else _path_compare
-            ),
-        )
-        files = sorted(
-            [Path(x) for x in lst if _is_audiofile(src / x)],
-            key=functools.cmp_to_key(
-                (lambda xf, yf: _file_compare(yf, xf))
-                if _ARGS.reverse
-                else _file_compare
-            ),
-        )
+        name = unified_stem + file.suffix if unified_stem else file.name
+        if len(step_down) > 0:
+            if step_down is not last_step_down:  # Shared by a directory's files.
+                last_step_down = step_down
+                subdir_prefix = f"[{']['.join(step_down)}]-"
+            return f"{i:{pad}}-{subdir_prefix}{name}"
+        return f"{i:{pad}}-{name}"
 
-    def walk_into(dirs: List[Path]) -> _DirWalkIterator:
-        for directory in dirs:
-            step = list(step_down)
-            step.append(directory.name)
-            yield from _dir_walk(src / directory, step, fcount)
+    return file_decorate
 
-    def walk_along(files: List[Path]) -> _DirWalkIterator:
-        for file in files:
-            yield fcount[0], step_down, file
-            fcount[0] += fcount[1]  # [counter, const increment_by]
 
-    if _ARGS.reverse:
-        yield from walk_along(files)
-        yield from walk_into(dirs)
-    else:
-        yield from walk_into(dirs)
-        yield from walk_along(files)
+_DirWalkStep = Tuple[List[str], Path]
+_DirWalkItem = Tuple[int, List[str], Path]
+_DirWalkIterator = Iterator[_DirWalkItem]
 
 
-def _audiofiles_count(
-    directory: Path, spinner=None
-) -> Tuple[int, int]:  # pragma: no cover
-    """
-    Returns full recursive count of audiofiles in directory.
+def _dir_walk(
+    src: Path, step_down: List[str], steps: List[_DirWalkStep], spinner=None
+) -> None:  # pragma: no cover
     """
-    if _is_audiofile(directory, spinner):
-        return 1, directory.stat().st_size
-
-    if directory.is_file():
-        return 0, 0
-
-    cnt, size = 0, 0
+    Walks down the src tree, depth first, accumulating step_down on each level;
+    an explicit stack instead of recursion, so any depth goes.
+    Appends to steps, in copying order, a tuple of:
+    (list of subdirectories to be joined
+    at destination if necessary, source audiofile path)
+    This is the only walk: the audiofiles are counted as len(steps).
+    """
+    accepted = _file_type_filter()
+
+    if src.is_file():  # SRC as a single file; below, the types come from scandir.
+        if accepted(src.name) and _mutagen_file(src, spinner) is not None:
+            steps.append((step_down, src))
+        return
+
+    # Options looked up once per walk, not per entry.
+    reverse = _ARGS.reverse
+    dir_key, file_key = _sort_keys()
+
+    # A pending directory comes with None; its files, deferred
+    # past its subdirectories, come with the list. Directories are
+    # plain DirEntry path strings; Path objects are made for audiofiles only.
+    stack: List[Tuple[List[str], str, List[Path] | None]] = [
+        (step_down, str(src), None)
+    ]
 
-    for root, _dirs, files in os.walk(directory):
-        for name in files:
-            abs_path = Path(root) / name
-            if _is_audiofile(abs_path, spinner):
-                if spinner and cnt % 10 == 0:
-                    spinner.text = name
-                cnt += 1
-                size += abs_path.stat().st_size
-    return cnt, size
+    while stack:
+        step_down, directory, deferred = stack.pop()
+        if deferred is not None:
+            steps.extend((step_down, file) for file in deferred)
+            continue
+
+        dirs: List[os.DirEntry] = []
+        files: List[Path] = []
+        with os.scandir(directory) as entries:  # One pass, file types cached.
+            for entry in entries:
+                if entry.is_dir():
+                    dirs.append(entry)
+                elif entry.is_file() and accepted(entry.name):
+                    file = Path(entry.path)
+                    if _mutagen_file(file, spinner) is not None:
+                        if spinner and len(files) % 10 == 0:
+                            spinner.text = entry.name
+                        files.append(file)
+        dirs.sort(key=dir_key, reverse=reverse)
+        files.sort(key=file_key, reverse=reverse)
+
+        if reverse:
+            steps.extend((step_down, file) for file in files)
+        else:
+            stack.append((step_down, directory, files))
+        stack.extend(
+            (step_down + [entry.name], entry.path, None) for entry in reversed(dirs)
+        )
 
 
 def _dst_calculate() -> str:
@@ -259,7 +309,7 @@ def _dst_calculate() -> str:
         ""
         if _ARGS.drop_dst
         else (
-            ((str(_ARGS.album_num).zfill(2) + "-") if _ARGS.album_num else "")
+            (f"{_ARGS.album_num:02d}-" if _ARGS.album_num else "")
             + (
                 _artist_part(suffix=" - ") + _ARGS.unified_name
                 if _ARGS.unified_name
@@ -271,11 +321,11 @@ def _dst_calculate() -> str:
     )
 
 
-def _album() -> _DirWalkIterator:  # pragma: no cover
+def _album(steps: List[_DirWalkStep]) -> _DirWalkIterator:  # pragma: no cover
     """
     Sets up boilerplate required by the options and returns the ammo belt generator of
     (index, list of subdirectories to be joined
-    at destination if necessary, source audiofile name) tuples.
+    at destination if necessary, source audiofile path) tuples.
     """
     if _FILES_TOTAL < 1:
         _show(
@@ -285,21 +335,28 @@ def _album() -> _DirWalkIterator:  # pragma: no cover
         sys.exit(1)
 
     if not _ARGS.drop_dst and not _ARGS.dry_run:
-        if _ARGS.dst_dir.exists():
-            if _ARGS.overwrite:
-                try:
-                    shutil.rmtree(_ARGS.dst_dir)
-                except FileNotFoundError:
-                    _show(f' {WARNING_ICON} Failed to remove "{_ARGS.dst_dir}".')
-                    sys.exit(1)
-            else:
+        try:
+            _ARGS.dst_dir.mkdir()  # No separate probe; mkdir tells.
+        except FileExistsError:
+            if not _ARGS.overwrite:
                 _show(
                     f' {WARNING_ICON} Target directory "{_ARGS.dst_dir}" already exists.'
                 )
                 sys.exit(1)
-        _ARGS.dst_dir.mkdir()
+            try:
+                shutil.rmtree(_ARGS.dst_dir)
+            except FileNotFoundError:
+                _show(f' {WARNING_ICON} Failed to remove "{_ARGS.dst_dir}".')
+                sys.exit(1)
+            _ARGS.dst_dir.mkdir()
+
+    if _ARGS.tree_dst and not _ARGS.dry_run:  # In one go, in order of appearance.
+        for step_down in dict.fromkeys(tuple(step_down) for step_down, _ in steps):
+            _ARGS.dst_dir.joinpath(*step_down).mkdir(parents=True, exist_ok=True)
 
-    return _dir_walk(_ARGS.src, [], [_FILES_TOTAL, -1] if _ARGS.reverse else [1, 1])
+    # Number one file is the last one to be copied in reverse.
+    numbers = range(len(steps), 0, -1) if _ARGS.reverse else range(1, len(steps) + 1)
+    return ((i, step_down, file) for i, (step_down, file) in zip(numbers, steps))
 
 
 def human_rough(bytes: int, units=["", "kB", "MB", "GB", "TB", "PB", "EB"]) -> str:
@@ -343,96 +400,190 @@ def human_fine(bytes: int) -> str:
     return "1" if bytes == 1 else f"human_fine error; bytes: {bytes}"
 
 
-def _album_copy() -> None:  # pragma: no cover
+_Item = TypeVar("_Item")
+_Result = TypeVar("_Result")
+
+
+def _run_ahead(
+    func: Callable[[_Item], _Result],
+    items: Iterable[_Item],
+    discard: Callable[[_Result], object],
+    *,
+    workers: int | None = None,
+) -> Generator[Tuple[_Item, _Result], None, None]:
+    """
+    Yields (item, func(item)) pairs in the order of items, while func runs
+    in a thread pool, up to workers items ahead (one per CPU, up to 8, by default).
+    The results computed, but not yielded, are passed to discard,
+    if the generator gets closed early.
+    """
+    workers = workers or min(8, os.cpu_count() or 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        ahead: Deque[Tuple[_Item, Future]] = deque()
+        try:
+            for item in items:
+                ahead.append((item, pool.submit(func, item)))
+                if len(ahead) > workers:
+                    item, future = ahead.popleft()
+                    yield item, future.result()
+            while ahead:
+                item, future = ahead.popleft()
+                yield item, future.result()
+        finally:
+            for _, future in ahead:
+                if not future.cancel() and future.exception() is None:
+                    discard(future.result())
+
+
+def _tagged_copy(source: Path, tags: Dict[str, str]) -> SpooledTemporaryFile | None:
+    """
+    Returns a copy of source, tagged, spooled in memory (or spilled
+    to a temporary file, if large); None, if source is good as it is.
+    """
+    try:
+        audio = mutagen.File(source, easy=True)  # type: ignore
+    except mutagen.MutagenError:  # type: ignore
+        return None
+    if audio is None:
+        return None
+    if all(audio.get(tag) == [value] for tag, value in tags.items()):
+        return None  # Already tagged this way; no rewrite.
+
+    for tag, value in tags.items():
+        audio[tag] = value
+    spool = SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    with source.open("rb") as src_file:
+        shutil.copyfileobj(src_file, spool)
+    spool.seek(0)  # Some formats (FLAC) read the header back before saving.
+    audio.save(spool)  # The tags parsed from source, saved to its copy.
+    spool.seek(0)
+    return spool
+
+
+def _album_copy(steps: List[_DirWalkStep]) -> None:  # pragma: no cover
     """
     Runs through the ammo belt and does copying, in the reverse order if necessary.
     """
 
-    artist_initials: str = initials(_ARGS.artist) if _ARGS.artist else ""
-
-    def set_tags(i: int, source: Path, path: Path) -> None:
-        def make_title(tagging: str) -> str:
-            if _ARGS.file_title_num:
-                return str(i) + ">" + source.stem
-            if _ARGS.file_title:
-                return source.stem
-            return str(i) + " " + tagging
-
-        audio = _mutagen_file(path)
-        if audio is None:
-            return
-
-        if not _ARGS.drop_tracknumber:
-            audio["tracknumber"] = str(i) + "/" + str(_FILES_TOTAL)
-        if _ARGS.artist and _ARGS.album:
-            audio["title"] = make_title(artist_initials + " - " + _ARGS.album)
-            audio["artist"] = _ARGS.artist
-            audio["album"] = _ARGS.album
-        elif _ARGS.artist:
-            audio["title"] = make_title(_ARGS.artist)
-            audio["artist"] = _ARGS.artist
-        elif _ARGS.album:
-            audio["title"] = make_title(_ARGS.album)
-            audio["album"] = _ARGS.album
-        audio.save()
-
-    def copy_and_set(index: int, src: Path, dst: Path) -> None:
-        shutil.copy(src, dst)
-        set_tags(index, src, dst)
-
-    def copy_and_set_via_tmp(index: int, src: Path, dst: Path) -> None:
-        fd, path = mkstemp(suffix=src.suffix)
-        tmp = Path(path)
-        os.close(fd)
-        shutil.copy(src, tmp)
-        set_tags(index, src, tmp)
-        shutil.copy(tmp, dst)
-        os.remove(tmp)
-
-    def file_copy(entry: _DirWalkItem) -> Tuple[int, int]:
-        i, step_down, src_file = entry
-
-        src = _ARGS.src.joinpath(*step_down) / src_file
-        dst_path = (
-            _ARGS.dst_dir.joinpath(*step_down) if _ARGS.tree_dst else _ARGS.dst_dir
-        )
-        dst = dst_path / _file_decorate(i, step_down, src_file)
+    # Everything but the file number is the same for the whole album; worked out once.
+    tracknumber_total = "" if _ARGS.drop_tracknumber else "/" + str(_FILES_TOTAL)
+    album_tags: Dict[str, str] = {}
+    if _ARGS.artist:
+        album_tags["artist"] = _ARGS.artist
+    if _ARGS.album:
+        album_tags["album"] = _ARGS.album
+    title_tagging: str = (
+        initials(_ARGS.artist) + " - " + _ARGS.album
+        if _ARGS.artist and _ARGS.album
+        else _ARGS.artist or _ARGS.album or ""
+    )
+
+    def title_file_num(i: int, source: Path) -> str:
+        return str(i) + ">" + source.stem
+
+    def title_file(i: int, source: Path) -> str:  # pylint:disable=unused-argument
+        return source.stem
+
+    def title_num(i: int, source: Path) -> str:  # pylint:disable=unused-argument
+        return str(i) + " " + title_tagging
+
+    # Title variant picked once, per album.
+    make_title: Callable[[int, Path], str] | None = (
+        None
+        if not title_tagging
+        else title_file_num
+        if _ARGS.file_title_num
+        else title_file
+        if _ARGS.file_title
+        else title_num
+    )
+
+    def tagged_copy(entry: _DirWalkItem) -> SpooledTemporaryFile | None:
+        i, _, source = entry
+
+        tags: Dict[str, str] = {}
+        if tracknumber_total:
+            tags["tracknumber"] = str(i) + tracknumber_total
+        if make_title:
+            tags["title"] = make_title(i, source)
+        tags.update(album_tags)
+        return _tagged_copy(source, tags)
+
+    tree_dst = _ARGS.tree_dst
+    last_step_down: List[str] = []
+    dst_path: Path = _ARGS.dst_dir
+
+    def file_copy(
+        entry: _DirWalkItem, spool: SpooledTemporaryFile | None
+    ) -> Tuple[int, int]:
+        nonlocal last_step_down, dst_path
+
+        i, step_down, src = entry
+
+        if tree_dst and step_down is not last_step_down:  # Once per directory.
+            last_step_down = step_down
+            dst_path = _ARGS.dst_dir.joinpath(*step_down)
+        dst = dst_path / file_decorate(i, step_down, src)
 
         src_bytes, dst_bytes = src.stat().st_size, 0
 
         if not _ARGS.dry_run:
-            dst_path.mkdir(parents=True, exist_ok=True)
             if dst.is_file():
                 _SHORT_LOG.append(
                     f'File "{dst.name}" already copied. Review your options.'
                 )
             else:
-                copy_and_set_via_tmp(i, src, dst)
+                try:
+                    if spool:
+                        with dst.open("wb") as dst_file:
+                            shutil.copyfileobj(spool, dst_file)
+                    else:
+                        _copyfile(src, dst)
+                except BaseException:  # Ctrl-C included; no half-written files.
+                    dst.unlink(missing_ok=True)
+                    raise
                 dst_bytes = dst.stat().st_size
 
-        if _ARGS.verbose:
-            _show(f"{i:>4}/{_FILES_TOTAL} {COLUMN_ICON} {dst}", end="")
+        if _ARGS.verbose:  # One write per file.
+            line = f"{i:>4}/{_FILES_TOTAL} {COLUMN_ICON} {dst}"
             if dst_bytes != src_bytes:
                 if dst_bytes == 0:
-                    _show(f"  {COLUMN_ICON} {human_fine(src_bytes)}", end="")
+                    line += f"  {COLUMN_ICON} {human_fine(src_bytes)}"
                 else:
-                    _show(f"  {COLUMN_ICON} {(dst_bytes - src_bytes):+d}", end="")
-            _show("")
+                    line += f"  {COLUMN_ICON} {(dst_bytes - src_bytes):+d}"
+            _show(line)
         else:
-            _show(".", end="", flush=True)
+            _show(".", end="", flush=dots_flush)
 
         return src_bytes, dst_bytes
 
+    # Progress dots are pushed out one by one to a terminal only;
+    # redirected, they are left to the buffer.
+    dots_flush = sys.stdout.isatty()
     if not _ARGS.verbose:
         _show("Starting ", end="", flush=True)
 
     src_total, dst_total, files_total = 0, 0, 0
 
-    for entry in _album():
-        src_bytes, dst_bytes = file_copy(entry)
-        src_total += src_bytes
-        dst_total += dst_bytes
-        files_total += 1
+    belt = _album(steps)
+    file_decorate = _file_decorator()
+    # Sources are read and tagged in memory in parallel, a few files ahead;
+    # the destination files are still written strictly one by one, in order,
+    # each in a single pass. Without any tags to set, sources are copied as they are.
+    retag = not _ARGS.drop_tracknumber or _ARGS.artist or _ARGS.album
+    with closing(
+        ((entry, None) for entry in belt)
+        if _ARGS.dry_run or not retag
+        else _run_ahead(tagged_copy, belt, _spool_close, workers=_ARGS.jobs)
+    ) as copies:
+        for entry, spool in copies:
+            try:
+                src_bytes, dst_bytes = file_copy(entry, spool)
+            finally:
+                _spool_close(spool)
+            src_total += src_bytes
+            dst_total += dst_bytes
+            files_total += 1
 
     _show(f" {DONE_ICON} Done ({files_total}, {human_fine(dst_total)}", end="")
     if _ARGS.dry_run:
@@ -442,6 +593,37 @@ def _album_copy() -> None:  # pragma: no cover
         _show(f"Fatal error. files_total: {files_total}, _FILES_TOTAL: {_FILES_TOTAL}")
 
 
+def _copyfile(src: Path, dst: Path) -> None:  # pragma: no cover
+    """
+    Copies src to dst via os.copy_file_range, where available: a reflink
+    on copy-on-write file systems (Btrfs, XFS), an in-kernel copy elsewhere.
+    Copies until the kernel reports EOF, as st_size may be off (procfs says 0).
+    Falls back to shutil.copyfile, starting over, if the kernel copies nothing
+    (unsupported, or an empty file: cheap either way) or falls short of st_size.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with src.open("rb") as src_file, dst.open("wb") as dst_file:
+                left = os.fstat(src_file.fileno()).st_size
+                copied_total = 0
+                while copied := os.copy_file_range(
+                    src_file.fileno(), dst_file.fileno(), max(left, COPY_CHUNK)
+                ):
+                    copied_total += copied
+                    left -= copied
+                if copied_total > 0 and left <= 0:
+                    return
+        except OSError:  # Cross-device on older kernels, unsupported, etc.
+            pass
+        dst.unlink(missing_ok=True)
+    shutil.copyfile(src, dst)
+
+
+def _spool_close(spool: SpooledTemporaryFile | None) -> None:  # pragma: no cover
+    if spool:
+        spool.close()
+
+
 def _show(
     string: str, *, end="\n", file=sys.stdout, flush=False
 ) -> None:  # pragma: no cover
@@ -498,7 +680,7 @@ def initials(authors: str) -> str:
                 if ch.isupper():
                     return prefix
 
-        if name in [
+        if name in {  # Folded into a frozenset constant.
             "von",
             "фон",
             "van",
@@ -542,7 +724,7 @@ def initials(authors: str) -> str:
             "haut",
             "от",
             "the",
-        ]:
+        }:
             return name[0]
         return name[0].upper()
 
@@ -566,13 +748,25 @@ COMMA = ","
 RE_BY_SEP = re.compile(rf"[\s{SEP}]+")
 RE_BY_HYPH = re.compile(rf"\s*(?:{HYPH}\s*)+")
 RE_QUOTED_SUBSTRING = re.compile(r"\"(?:\\.|[^\"\\])*\"")
+RE_DIGITS = re.compile(r"\d+")
+RE_DIGIT_RUNS = re.compile(r"(\d+)")
 
 WARNING_ICON = "\U0001f4a7"
 INVALID_ICON = "\U0000274c"
 SUSPICIOUS_ICON = "\U00002754"
 DONE_ICON = "\U0001f7e2"
 COLUMN_ICON = "\U00002714"
+COPY_CHUNK = 1024 * 1024  # Kernel copy request, past st_size.
+SPOOL_MAX_SIZE = 8 * 1024 * 1024  # Per file in RAM, jobs + 1 files; beyond, on disk.
 KNOWN_EXTENSIONS = ["MP3", "OGG", "M4A", "M4B", "OPUS", "WMA", "FLAC", "APE"]
+AUDIO_EXTENSIONS = frozenset(  # Whatever mutagen.File() parses, by extension.
+    KNOWN_EXTENSIONS
+    + ["MP2", "MPG", "MPEG", "MPGA", "OGA", "OGV", "OGX", "SPX"]
+    + ["M4P", "M4R", "M4V", "MP4", "3GP", "3G2", "AAC", "ADTS", "ADIF"]
+    + ["AC3", "EAC3", "ASF", "WMV", "MPC", "MP+", "MPP", "WV", "OFR", "OFS"]
+    + ["TTA", "TAK", "DSF", "DFF", "WAV", "WAVE", "AIF", "AIFF", "AIFC"]
+    + ["MID", "MIDI"]
+)
 CLEAN_CONTEXT_PARAMS = {
     "context": False,
     "verbose": False,
@@ -595,8 +789,9 @@ CLEAN_CONTEXT_PARAMS = {
     "artist": None,
     "album": None,
     "album_num": None,
+    "jobs": None,
     "no_console": False,
-}  # 22 of them.
+}  # 23 of them.
 
 
 class RestrictedDotDict(dict):  # pragma: no cover
@@ -683,44 +878,45 @@ def _run() -> int:  # pragma: no cover
     if _ARGS.unified_name and _ARGS.album is None:
         _ARGS.album = _ARGS.unified_name
 
-    try:
-        warnings.resetwarnings()
-        warnings.simplefilter("ignore")
-
-        if _ARGS.no_console:
-            _FILES_TOTAL, bytes_total = _audiofiles_count(_ARGS.src)
-        else:
-            with yaspin() as sp:
-                _FILES_TOTAL, bytes_total = _audiofiles_count(_ARGS.src, sp)
-
-        if _ARGS.count:
-            _show(
-                f" {DONE_ICON if _FILES_TOTAL else WARNING_ICON}"
-                + f" Valid: {_FILES_TOTAL} file(s)",
-                end="",
-            )
-            _show(f"; Volume: {human_fine(bytes_total)}", end="")
-            if _FILES_TOTAL > 1:
-                _show(f"; Average: {human_fine(bytes_total // _FILES_TOTAL)}", end="")
-            _show(f"; Time: {(perf_counter() - _START_TIME):.1f}s")
-        else:
-            _INVALID_TOTAL = 0
-            _SUSPICIOUS_TOTAL = 0
+    with warnings.catch_warnings():  # The caller's filters are restored on return.
+        warnings.filterwarnings("ignore", module="mutagen")  # Its own chatter only.
+        try:
+            steps: List[_DirWalkStep] = []
+            if _ARGS.no_console:
+                _dir_walk(_ARGS.src, [], steps)
+            else:
+                with yaspin() as sp:
+                    _dir_walk(_ARGS.src, [], steps, sp)
+            _FILES_TOTAL = len(steps)
 
-            _album_copy()
+            if _ARGS.count:
+                bytes_total = sum(file.stat().st_size for _, file in steps)
+                _show(
+                    f" {DONE_ICON if _FILES_TOTAL else WARNING_ICON}"
+                    + f" Valid: {_FILES_TOTAL} file(s)",
+                    end="",
+                )
+                _show(f"; Volume: {human_fine(bytes_total)}", end="")
+                if _FILES_TOTAL > 1:
+                    _show(
+                        f"; Average: {human_fine(bytes_total // _FILES_TOTAL)}", end=""
+                    )
+                _show(f"; Time: {(perf_counter() - _START_TIME):.1f}s")
+            else:
+                _album_copy(steps)
 
-        if _INVALID_TOTAL > 0:
-            _show(f" {INVALID_ICON} Broken: {_INVALID_TOTAL} file(s)")
-        if _SUSPICIOUS_TOTAL > 0:
-            _show(f" {SUSPICIOUS_ICON} Suspicious: {_SUSPICIOUS_TOTAL} file(s)")
+            if _INVALID_TOTAL > 0:
+                _show(f" {INVALID_ICON} Broken: {_INVALID_TOTAL} file(s)")
+            if _SUSPICIOUS_TOTAL > 0:
+                _show(f" {SUSPICIOUS_ICON} Suspicious: {_SUSPICIOUS_TOTAL} file(s)")
 
-        for line in _SHORT_LOG:
-            _show(f" {WARNING_ICON} {line}")
-        _SHORT_LOG.clear()
+            for line in _SHORT_LOG:
+                _show(f" {WARNING_ICON} {line}")
+            _SHORT_LOG.clear()
 
-    except KeyboardInterrupt:
-        _show(f" {WARNING_ICON} Aborted manually.", file=sys.stderr)
-        return 1
+        except KeyboardInterrupt:
+            _show(f" {WARNING_ICON} Aborted manually.", file=sys.stderr)
+            return 1
 
     return 0
 
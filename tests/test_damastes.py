@@ -1,12 +1,15 @@
 import copy
-import os
+from contextlib import closing
 from pathlib import Path
+from types import SimpleNamespace
+
+import mutagen
 
 import src.damastes.shoot as shoot
 # fmt: off
 from src.damastes import (CLEAN_CONTEXT_PARAMS, RestrictedDotDict, __version__,
                           human_fine, initials, str_strip_numbers, strcmp_c,
-                          strcmp_naturally)
+                          strcmp_naturally, strkey_naturally)
 
 # fmt: on
 
@@ -52,6 +55,21 @@ class TestPureFunctions:
         assert strcmp_naturally("2a", "10a") == -1
         assert strcmp_naturally("alfa", "bravo") == -1
 
+    def test_strkey_naturally(self):
+        assert strkey_naturally("") == ("",)
+        assert strkey_naturally("ab11cdd2k.144") == ("ab", 11, "cdd", 2, "k.", 144, "")
+        assert strkey_naturally("2a") < strkey_naturally("10a")
+        assert strkey_naturally("alfa") < strkey_naturally("bravo")
+        assert sorted(
+            ["Outro", "10 Ten", "02 Two", "01 Intro"], key=strkey_naturally
+        ) == ["01 Intro", "02 Two", "10 Ten", "Outro"]
+        assert sorted(
+            ["Extras", "Disc 10", "Disc 2", "Disc 1"], key=strkey_naturally
+        ) == ["Disc 1", "Disc 2", "Disc 10", "Extras"]
+        assert sorted(
+            ["zulu", "Disc 2", "bonus", "2charlie", "10alfa"], key=strkey_naturally
+        ) == ["2charlie", "10alfa", "Disc 2", "bonus", "zulu"]
+
     def test_initials(self):
         """
         There are four delimiters: comma, hyphen, dot, and space.
@@ -134,16 +152,37 @@ class TestNonPureHelpers:
     def test_compare(self, monkeypatch):
         args = self.new_args()
         monkeypatch.setattr(shoot, "_ARGS", args)
+        dirs = [SimpleNamespace(name=name) for name in ["Extras", "10alfa", "2bravo"]]
+        files = [Path("Alfa.ogg"), Path("alfa.mp3"), Path("10alfa.mp3"), Path("2bravo")]
 
         args.sort_lex = True
-        assert shoot._path_compare(Path("alfa"), Path("alfa" + os.path.sep)) == 0
-        assert shoot._path_compare(Path("10alfa"), Path("2bravo")) == -1
-        assert shoot._file_compare(Path("10alfa"), Path("2bravo")) == -1
-        assert shoot._file_compare(Path("alfa.ogg"), Path("alfa.mp3")) == 0
-        assert shoot._file_compare(Path("Alfa.ogg"), Path("alfa.mp3")) == -1
+        dir_key, file_key = shoot._sort_keys()
+        assert [d.name for d in sorted(dirs, key=dir_key)] == [
+            "10alfa",
+            "2bravo",
+            "Extras",
+        ]
+        assert file_key(Path("alfa.ogg")) == file_key(Path("alfa.mp3"))
+        assert [f.name for f in sorted(files, key=file_key)] == [
+            "10alfa.mp3",
+            "2bravo",
+            "Alfa.ogg",
+            "alfa.mp3",
+        ]
         args.sort_lex = False
-        assert shoot._path_compare(Path("10alfa"), Path("2bravo")) == 1
-        assert shoot._file_compare(Path("10alfa"), Path("2bravo")) == 1
+        dir_key, file_key = shoot._sort_keys()
+        assert [d.name for d in sorted(dirs, key=dir_key)] == [
+            "2bravo",
+            "10alfa",
+            "Extras",
+        ]
+        assert file_key(Path("alfa.ogg")) == file_key(Path("alfa.mp3"))
+        assert [f.name for f in sorted(files, key=file_key)] == [
+            "2bravo",
+            "10alfa.mp3",
+            "Alfa.ogg",
+            "alfa.mp3",
+        ]
 
     def test_decorate(self, monkeypatch):
         args = self.new_args()
@@ -156,23 +195,87 @@ class TestNonPureHelpers:
         assert shoot._artist_part(prefix=" - ") == " - Daniel Defoe"
         assert shoot._artist_part() == "Daniel Defoe"
 
-        assert shoot._file_decorate(7, ["deeper"], Path("delta.m4a")) == "07-delta.m4a"
+        assert (
+            shoot._file_decorator()(7, ["deeper"], Path("delta.m4a")) == "07-delta.m4a"
+        )
         args.prepend_subdir_name = True
         assert (
-            shoot._file_decorate(7, ["deeper", "yet"], Path("delta.m4a"))
+            shoot._file_decorator()(7, ["deeper", "yet"], Path("delta.m4a"))
             == "07-[deeper][yet]-delta.m4a"
         )
         args.strip_decorations = True
         assert (
-            shoot._file_decorate(7, ["deeper"], Path("delta.m4a"))
+            shoot._file_decorator()(7, ["deeper"], Path("delta.m4a"))
             == "07-[deeper]-delta.m4a"
         )
         args.tree_dst = True
-        assert shoot._file_decorate(7, ["deeper"], Path("delta.m4a")) == "delta.m4a"
+        assert shoot._file_decorator()(7, ["deeper"], Path("delta.m4a")) == "delta.m4a"
         monkeypatch.setattr(shoot, "_FILES_TOTAL", 533)
         args.strip_decorations = False
         args.tree_dst = False
         assert (
-            shoot._file_decorate(7, ["deeper"], Path("delta.m4a"))
+            shoot._file_decorator()(7, ["deeper"], Path("delta.m4a"))
             == "007-[deeper]-delta.m4a"
         )
+        decorate = shoot._file_decorator()  # Prefix reused per directory.
+        deeper, yet = ["deeper"], ["deeper", "yet"]
+        assert [
+            decorate(i, step_down, Path("delta.m4a"))
+            for i, step_down in [(1, deeper), (2, deeper), (3, yet), (4, [])]
+        ] == [
+            "001-[deeper]-delta.m4a",
+            "002-[deeper]-delta.m4a",
+            "003-[deeper][yet]-delta.m4a",
+            "004-delta.m4a",
+        ]
+
+    def test_file_type_filter(self, monkeypatch):
+        args = self.new_args()
+        monkeypatch.setattr(shoot, "_ARGS", args)
+
+        accepted = shoot._file_type_filter()
+        assert accepted("alfa.mp3") and accepted("bravo.Flac")
+        assert not accepted("desktop.ini") and not accepted(".mp3")
+        assert all(
+            accepted(f"alfa.{ext}")
+            for ext in ["mp2", "aifc", "m4p", "m4r", "dff", "ofr", "ofs", "ac3", "asf"]
+        )
+        args.file_type = ".OGG"
+        accepted = shoot._file_type_filter()
+        assert accepted("alfa.ogg") and not accepted("alfa.mp3")
+        args.file_type = "*64kb.mp3"
+        accepted = shoot._file_type_filter()
+        assert accepted("alfa_64kb.mp3") and not accepted("alfa_128kb.mp3")
+
+    def test_tagged_copy(self, tmp_path):
+        streaminfo = bytes([16, 0, 16, 0]) + bytes(6)  # Block sizes, frame sizes.
+        streaminfo += ((44100 << 44) | (1 << 41) | (15 << 36)).to_bytes(8, "big")
+        source = tmp_path / "alfa.flac"
+        source.write_bytes(b"fLaC" + bytes([0x80, 0, 0, 34]) + streaminfo + bytes(16))
+        tags = {"tracknumber": "1/8", "artist": "Daniel Defoe"}
+
+        with shoot._tagged_copy(source, tags) as spool:
+            copy = tmp_path / "bravo.flac"
+            copy.write_bytes(spool.read())
+        audio = mutagen.File(copy, easy=True)
+        assert audio["tracknumber"] == ["1/8"] and audio["artist"] == ["Daniel Defoe"]
+        assert shoot._tagged_copy(copy, tags) is None  # Already tagged.
+        assert shoot._tagged_copy(tmp_path / "missing.flac", tags) is None
+
+    def test_run_ahead(self):
+        done, discarded = [], []
+
+        def square(x):
+            done.append(x)
+            return x * x
+
+        assert list(shoot._run_ahead(square, range(10), discarded.append)) == [
+            (x, x * x) for x in range(10)
+        ]
+        done.clear()
+        with closing(
+            shoot._run_ahead(square, range(10), discarded.append, workers=2)
+        ) as pairs:
+            assert next(pairs) == (0, 0)
+        assert sorted(discarded) == sorted(x * x for x in done if x > 0)
+        assert len(done) <= 4